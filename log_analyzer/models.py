@@ -1,8 +1,15 @@
 # -- coding: utf-8
 """Models for log analyzer."""
 
+import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+MASK = "<*>"
+# Numbers, IP addresses, timings, hex ids: tokens that vary between otherwise equal messages
+VARIABLE_TOKEN = re.compile(r"^[\[\(]?(?:\d[\d.:,\-]*|0x[0-9a-fA-F]+)[\]\)]?[;,]?$")
+HAS_DIGIT = re.compile(r"\d")
 
 
 @dataclass
@@ -47,3 +54,153 @@ class HandlersReport:
     def get_sorted_handlers(self) -> List[HandlerStats]:
         """Get handlers sorted by name."""
         return sorted(self.handlers.values(), key=lambda x: x.handler)
+
+
+@dataclass
+class ErrorTemplate:
+    """A group of error messages sharing the same template."""
+    level: str
+    logger: str
+    tokens: List[str]
+    count: int = 0
+    first_seen: str = ""
+    last_seen: str = ""
+    example: str = ""
+
+    @property
+    def template(self) -> str:
+        """Get the message template with variable tokens masked."""
+        return " ".join(self.tokens)
+
+    def similarity(self, tokens: List[str]) -> float:
+        """Get the share of template constant tokens equal to the message tokens.
+
+        Masked positions are left out, so a message always fully matches a
+        template it was merged into.
+        """
+        constant = same = 0
+        for a, b in zip(self.tokens, tokens):
+            if a != MASK:
+                constant += 1
+                if a == b:
+                    same += 1
+        return same / constant if constant else 1.0
+
+    def update(self, tokens: List[str], count: int, first_seen: str, last_seen: str, example: str) -> None:
+        """Add messages to the group, masking tokens that differ from the template."""
+        self.tokens = [a if a == b else MASK for a, b in zip(self.tokens, tokens)]
+        self.count += count
+        if first_seen and (not self.first_seen or first_seen < self.first_seen):
+            self.first_seen = first_seen
+        if last_seen and last_seen > self.last_seen:
+            self.last_seen = last_seen
+        if not self.example:
+            self.example = example
+
+
+@dataclass
+class ErrorsReport:
+    """Report grouping error messages into templates.
+
+    Templates are kept in a Drain-style fixed depth prefix tree: messages are
+    split by level, logger, number of tokens and the first ``depth`` tokens,
+    and only the few templates in matching leaves are compared with the message.
+    Prefix tokens containing digits go to the wildcard branch, and every
+    template is also reachable with one of its prefix tokens replaced by the
+    wildcard, so a variable word at the start of a message does not split it.
+    A leaf holds at most ``max_templates`` templates, which bounds the work per
+    message. Templates are also indexed by their exact tokens, and recently
+    seen messages are kept in an LRU cache.
+    """
+    templates: List[ErrorTemplate] = field(default_factory=list)
+    depth: int = 2
+    threshold: float = 0.6
+    max_templates: int = 100
+    cache_size: int = 10000
+    _tree: Dict[tuple, List[ErrorTemplate]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _index: Dict[tuple, ErrorTemplate] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cache: 'OrderedDict[tuple, ErrorTemplate]' = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def total_errors(self) -> int:
+        """Get total number of error messages."""
+        return sum(template.count for template in self.templates)
+
+    @staticmethod
+    def tokenize(message: str) -> List[str]:
+        """Split a message into tokens with variable tokens masked."""
+        return [MASK if VARIABLE_TOKEN.match(token) else token for token in message.split()]
+
+    def _leaves(self, level: str, logger: str, tokens: List[str]) -> List[tuple]:
+        """Get the tree leaves for the tokens, the exact prefix leaf first."""
+        prefix = [MASK if HAS_DIGIT.search(token) else token for token in tokens[:self.depth]]
+        leaves = [(level, logger, len(tokens), tuple(prefix))]
+        for i, token in enumerate(prefix):
+            if token != MASK:
+                leaves.append((level, logger, len(tokens), tuple(prefix[:i] + [MASK] + prefix[i + 1:])))
+        return leaves
+
+    def _find(self, level: str, logger: str, tokens: List[str]) -> Optional[ErrorTemplate]:
+        """Find the most similar template for the tokens."""
+        best = self._index.get((level, logger, tuple(tokens)))
+        if best is not None:
+            return best
+
+        best_similarity = self.threshold
+        for leaf in self._leaves(level, logger, tokens):
+            for template in self._tree.get(leaf, []):
+                similarity = template.similarity(tokens)
+                if similarity >= best_similarity:
+                    best, best_similarity = template, similarity
+        return best
+
+    def _register(self, template: ErrorTemplate) -> None:
+        """Put the template into the leaves and the index of its current tokens."""
+        self._index[(template.level, template.logger, tuple(template.tokens))] = template
+        for leaf in self._leaves(template.level, template.logger, template.tokens):
+            bucket = self._tree.setdefault(leaf, [])
+            if len(bucket) < self.max_templates and not any(other is template for other in bucket):
+                bucket.append(template)
+
+    def _add(
+        self, level: str, logger: str, tokens: List[str], count: int,
+        first_seen: str, last_seen: str, example: str
+    ) -> None:
+        """Add messages with the given tokens to the matching template."""
+        key = (level, logger, tuple(tokens))
+        template = self._cache.get(key)
+        if template is not None:
+            self._cache.move_to_end(key)
+        else:
+            template = self._find(level, logger, tokens)
+            if template is None:
+                template = ErrorTemplate(level=level, logger=logger, tokens=list(tokens))
+                self.templates.append(template)
+                self._register(template)
+
+            if len(self._cache) >= self.cache_size:
+                self._cache.popitem(last=False)
+            self._cache[key] = template
+
+        old_tokens = template.tokens
+        template.update(tokens, count, first_seen, last_seen, example)
+        if template.tokens != old_tokens:
+            self._register(template)
+
+    def add(self, level: str, logger: str, message: str, timestamp: str = "", example: str = "") -> None:
+        """Add a single error message to the report."""
+        self._add(level, logger, self.tokenize(message), 1, timestamp, timestamp, example or message)
+
+    def merge(self, other: 'ErrorsReport') -> None:
+        """Merge another report into this one."""
+        for template in other.templates:
+            self._add(
+                template.level, template.logger, template.tokens, template.count,
+                template.first_seen, template.last_seen, template.example
+            )
+
+    def get_sorted_templates(self) -> List[ErrorTemplate]:
+        """Get templates sorted by count, most frequent first."""
+        return sorted(self.templates, key=lambda x: (-x.count, x.level, x.logger, x.template))
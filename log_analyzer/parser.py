@@ -3,10 +3,16 @@
 
 import json
 import re
+import sys
 from pathlib import Path
-from typing import Iterator, Dict, Any
+from typing import BinaryIO, Iterable, Iterator, Dict, Any, List, Tuple
 
-from log_analyzer.models import HandlerStats, HandlersReport
+from log_analyzer.models import ErrorsReport, HandlerStats, HandlersReport
+
+ERROR_LEVELS = {'WARNING', 'ERROR', 'CRITICAL'}
+# Sentinel for reading stdin, compared by identity so that a file named '-' can still be read as './-'
+STDIN = Path('-')
+READ_SIZE = 1024 * 1024
 
 
 def convert_log_line_to_json(line: str) -> Dict[str, Any]:
@@ -35,43 +41,122 @@ def convert_log_line_to_json(line: str) -> Dict[str, Any]:
     }
 
 
+def convert_message_line_to_json(line: str) -> Dict[str, Any]:
+    """Convert a text log line of any logger to JSON format.
+
+    Example inputs:
+    2025-03-28 12:40:47,000 CRITICAL django.core.management: DatabaseError: Deadlock detected
+    [2024-03-20 10:15:31,890] CRITICAL [django.core] Database connection failed: Connection refused
+    """
+    pattern = r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) (\w+) ([\w\.]+): (.*)"
+    match = re.match(pattern, line.strip())
+
+    if not match:
+        pattern = r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3})\] (\w+) \[([\w\.]+)\] (.*)"
+        match = re.match(pattern, line.strip())
+
+    if not match:
+        return {}
+
+    timestamp, level, logger, message = match.groups()
+
+    return {
+        "timestamp": timestamp,
+        "levelname": level,
+        "logger": logger,
+        "message": message
+    }
+
+
+def parse_log_line(line: str, report: HandlersReport) -> None:
+    """Parse a single log line and add it to the report."""
+    try:
+        # First try to parse as JSON
+        try:
+            log_entry = json.loads(line)
+        except json.JSONDecodeError:
+            # If JSON parsing fails, try to parse as text format
+            log_entry = convert_log_line_to_json(line)
+
+        if 'logger' in log_entry and log_entry['logger'] == 'django.request':
+            handler = log_entry.get('path', '')
+            level = log_entry.get('levelname', '').upper()
+
+            if not handler:
+                return
+
+            if handler not in report.handlers:
+                report.handlers[handler] = HandlerStats(handler=handler)
+
+            stats = report.handlers[handler]
+            if level == 'DEBUG':
+                stats.debug += 1
+            elif level == 'INFO':
+                stats.info += 1
+            elif level == 'WARNING':
+                stats.warning += 1
+            elif level == 'ERROR':
+                stats.error += 1
+            elif level == 'CRITICAL':
+                stats.critical += 1
+    except Exception:
+        return
+
+
 def parse_log_file(file_path: Path) -> HandlersReport:
     """Parse a single log file and return a report."""
     report = HandlersReport()
 
     with open(file_path, 'r', encoding='utf-8') as f:
         for line in f:
-            try:
-                # First try to parse as JSON
-                try:
-                    log_entry = json.loads(line)
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try to parse as text format
-                    log_entry = convert_log_line_to_json(line)
-
-                if 'logger' in log_entry and log_entry['logger'] == 'django.request':
-                    handler = log_entry.get('path', '')
-                    level = log_entry.get('levelname', '').upper()
-
-                    if not handler:
-                        continue
-
-                    if handler not in report.handlers:
-                        report.handlers[handler] = HandlerStats(handler=handler)
-
-                    stats = report.handlers[handler]
-                    if level == 'DEBUG':
-                        stats.debug += 1
-                    elif level == 'INFO':
-                        stats.info += 1
-                    elif level == 'WARNING':
-                        stats.warning += 1
-                    elif level == 'ERROR':
-                        stats.error += 1
-                    elif level == 'CRITICAL':
-                        stats.critical += 1
-            except Exception:
-                continue
+            parse_log_line(line, report)
+
+    return report
+
+
+def read_chunks(stream: BinaryIO, size: int = READ_SIZE) -> Iterator[bytes]:
+    """Read a binary stream in large chunks until EOF."""
+    return iter(lambda: stream.read(size), b'')
+
+
+def iter_line_blocks(chunks: Iterable[bytes], pending: List[bytes]) -> Iterator[Tuple[List[str], int]]:
+    """Split a stream of byte chunks into blocks of complete lines.
+
+    Yields the lines of each block with the number of bytes they take. Lines
+    may be split across chunk boundaries: the incomplete tail of a chunk is
+    kept in ``pending`` and joined with the next one, and is left there when
+    the chunks run out.
+    """
+    for chunk in chunks:
+        end = chunk.rfind(b'\n') + 1
+        if not end:
+            if chunk:
+                pending.append(chunk)
+            continue
+
+        pending.append(chunk[:end])
+        data = b''.join(pending)
+        pending[:] = [chunk[end:]]
+        yield data.decode('utf-8', errors='replace').split('\n')[:-1], len(data)
+
+
+def iter_stream_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Split a stream of byte chunks into lines."""
+    pending: List[bytes] = []
+    for lines, _ in iter_line_blocks(chunks, pending):
+        yield from lines
+
+    tail = b''.join(pending)
+    if tail:
+        yield tail.decode('utf-8', errors='replace')
+
+
+def parse_stream(chunks: Iterable[bytes]) -> HandlersReport:
+    """Parse a stream of byte chunks (pipe, socket, producer) and return a report."""
+    report = HandlersReport()
+
+    for line in iter_stream_lines(chunks):
+        parse_log_line(line, report)
 
     return report
 
@@ -81,10 +166,75 @@ def parse_log_files(file_paths: Iterator[Path]) -> HandlersReport:
     combined_report = HandlersReport()
 
     for file_path in file_paths:
-        if not file_path.exists():
+        if file_path is STDIN:
+            report = parse_stream(read_chunks(sys.stdin.buffer))
+        elif not file_path.exists():
+            raise FileNotFoundError(f"Log file not found: {file_path}")
+        else:
+            report = parse_log_file(file_path)
+
+        combined_report.merge(report)
+
+    return combined_report
+
+
+def parse_error_line(line: str, report: ErrorsReport) -> None:
+    """Parse a single log line and add it to the errors report if it is WARNING or above."""
+    try:
+        try:
+            log_entry = json.loads(line)
+        except json.JSONDecodeError:
+            log_entry = convert_message_line_to_json(line)
+
+        level = log_entry.get('levelname', '').upper()
+        message = log_entry.get('message', '')
+        if level not in ERROR_LEVELS or not message:
+            return
+
+        report.add(
+            level,
+            log_entry.get('logger', ''),
+            message,
+            timestamp=log_entry.get('timestamp', ''),
+            example=line.strip()
+        )
+    except Exception:
+        return
+
+
+def parse_error_file(file_path: Path) -> ErrorsReport:
+    """Parse a single log file and return an errors report."""
+    report = ErrorsReport()
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parse_error_line(line, report)
+
+    return report
+
+
+def parse_error_stream(chunks: Iterable[bytes]) -> ErrorsReport:
+    """Parse a stream of byte chunks and return an errors report."""
+    report = ErrorsReport()
+
+    for line in iter_stream_lines(chunks):
+        parse_error_line(line, report)
+
+    return report
+
+
+def parse_error_files(file_paths: Iterator[Path]) -> ErrorsReport:
+    """Parse multiple log files and return a combined errors report."""
+    combined_report = ErrorsReport()
+
+    for file_path in file_paths:
+        if file_path is STDIN:
+            report = parse_error_stream(read_chunks(sys.stdin.buffer))
+        elif not file_path.exists():
             raise FileNotFoundError(f"Log file not found: {file_path}")
+        else:
+            report = parse_error_file(file_path)
 
-        report = parse_log_file(file_path)
         combined_report.merge(report)
 
     return combined_report
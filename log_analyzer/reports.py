@@ -1,18 +1,23 @@
 # -- coding: utf-8
 """Report generation module."""
 
+import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterator, Protocol
+from typing import Any, Iterator, Optional, Protocol, TypeVar
 
-from log_analyzer.models import HandlersReport
-from log_analyzer.parser import parse_log_files
+from log_analyzer.models import ErrorsReport as ErrorsReportModel
+from log_analyzer.models import HandlersReport as HandlersReportModel
+from log_analyzer.parser import parse_error_files, parse_log_files
 
 
-class ReportFormatter(Protocol):
+ReportModel = TypeVar("ReportModel", contravariant=True)
+
+
+class ReportFormatter(Protocol[ReportModel]):
     """Protocol for report formatters."""
 
-    def format(self, report: HandlersReport) -> str:
+    def format(self, report: ReportModel) -> str:
         """Format the report as a string."""
         ...
 
@@ -21,17 +26,22 @@ class Report(ABC):
     """Base class for all reports."""
 
     name: str
+    formatter: ReportFormatter[Any]
 
     @abstractmethod
+    def parse(self, log_files: Iterator[Path]) -> Any:
+        """Parse the log files into the report model."""
+        pass
+
     def generate(self, log_files: Iterator[Path]) -> str:
         """Generate the report."""
-        pass
+        return self.formatter.format(self.parse(log_files))
 
 
 class HandlersReportFormatter:
     """Formatter for handlers report."""
 
-    def format(self, report: HandlersReport) -> str:
+    def format(self, report: HandlersReportModel) -> str:
         """Format the handlers report as a string."""
         lines = []
 
@@ -61,16 +71,102 @@ class HandlersReportFormatter:
         return "\n".join(lines)
 
 
+class JSONReportFormatter:
+    """Formatter for handlers report as JSON."""
+
+    def format(self, report: HandlersReportModel) -> str:
+        """Format the handlers report as a JSON document."""
+        handlers = []
+        for stats in report.get_sorted_handlers():
+            handlers.append({
+                "handler": stats.handler,
+                "debug": stats.debug,
+                "info": stats.info,
+                "warning": stats.warning,
+                "error": stats.error,
+                "critical": stats.critical,
+                "total": stats.total
+            })
+
+        return json.dumps({
+            "total_requests": report.total_requests,
+            "handlers": handlers
+        })
+
+
+class PrometheusReportFormatter:
+    """Formatter for handlers report in Prometheus text exposition format."""
+
+    metric = "django_requests_total"
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        """Escape a label value."""
+        return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+    def format(self, report: HandlersReportModel) -> str:
+        """Format the handlers report as Prometheus metrics."""
+        lines = [
+            f"# HELP {self.metric} Number of django.request log records by handler and level.",
+            f"# TYPE {self.metric} counter"
+        ]
+
+        for stats in report.get_sorted_handlers():
+            handler = self._escape(stats.handler)
+            for level in ("debug", "info", "warning", "error", "critical"):
+                lines.append(
+                    f'{self.metric}{{handler="{handler}",level="{level}"}} {getattr(stats, level)}'
+                )
+
+        return "\n".join(lines) + "\n"
+
+
 class HandlersReport(Report):
     """Handlers report implementation."""
 
     name = "handlers"
 
-    def __init__(self, formatter: ReportFormatter = None):
+    def __init__(self, formatter: Optional[ReportFormatter[HandlersReportModel]] = None):
         """Initialize the report with an optional formatter."""
         self.formatter = formatter or HandlersReportFormatter()
 
-    def generate(self, log_files: Iterator[Path]) -> str:
-        """Generate the handlers report."""
-        report = parse_log_files(log_files)
-        return self.formatter.format(report)
+    def parse(self, log_files: Iterator[Path]) -> HandlersReportModel:
+        """Parse the log files into the handlers report model."""
+        return parse_log_files(log_files)
+
+
+class ErrorsReportFormatter:
+    """Formatter for errors report."""
+
+    def format(self, report: ErrorsReportModel) -> str:
+        """Format the errors report as a string."""
+        lines = []
+
+        lines.append(f"Total errors: {report.total_errors}\n")
+
+        lines.append(
+            f"{'COUNT':<7}\t{'LEVEL':<8}\t{'LOGGER':<22}\t{'FIRST SEEN':<23}\t{'LAST SEEN':<23}\tTEMPLATE"
+        )
+
+        for template in report.get_sorted_templates():
+            lines.append(
+                f"{template.count:<7}\t{template.level:<8}\t{template.logger:<22}\t"
+                f"{template.first_seen:<23}\t{template.last_seen:<23}\t{template.template}"
+            )
+            lines.append(f"{'':7}\texample: {template.example}")
+
+        return "\n".join(lines)
+
+
+class ErrorsReport(Report):
+    """Errors report implementation."""
+
+    name = "errors"
+
+    def __init__(self, formatter: Optional[ReportFormatter[ErrorsReportModel]] = None):
+        """Initialize the report with an optional formatter."""
+        self.formatter = formatter or ErrorsReportFormatter()
+
+    def parse(self, log_files: Iterator[Path]) -> ErrorsReportModel:
+        """Parse the log files into the errors report model."""
+        return parse_error_files(log_files)
@@ -0,0 +1,188 @@
+# -- coding: utf-8
+"""Long-running aggregator service."""
+
+import os
+import socketserver
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+from log_analyzer.models import HandlersReport
+from log_analyzer.parser import iter_line_blocks, parse_log_line, read_chunks
+from log_analyzer.reports import JSONReportFormatter, PrometheusReportFormatter, ReportFormatter
+
+
+class LogAggregator:
+    """Keeps a warm report and ingests log files incrementally as they grow."""
+
+    def __init__(self, file_paths: Iterable[Path]):
+        """Initialize the aggregator with the log files to follow."""
+        self.file_paths = list(file_paths)
+        for file_path in self.file_paths:
+            if not file_path.exists():
+                raise FileNotFoundError(f"Log file not found: {file_path}")
+
+        self.report = HandlersReport()
+        self._lock = threading.Lock()
+        # file path -> (inode, number of bytes already consumed)
+        self._offsets: Dict[Path, Tuple[int, int]] = {}
+        self._version = 0
+        self._cache: Dict[str, Tuple[int, str]] = {}
+        self._formatters: Dict[str, ReportFormatter[HandlersReport]] = {
+            "json": JSONReportFormatter(),
+            "prometheus": PrometheusReportFormatter()
+        }
+
+    def _ingest_file(self, file_path: Path) -> int:
+        """Ingest complete lines appended to the file since the last call."""
+        count = 0
+        try:
+            f = open(file_path, 'rb')
+        except FileNotFoundError:
+            return 0
+
+        with f:
+            st = os.fstat(f.fileno())
+            inode, offset = self._offsets.get(file_path, (st.st_ino, 0))
+            # Start over if the file was rotated or truncated
+            if inode != st.st_ino or st.st_size < offset:
+                inode, offset = st.st_ino, 0
+            self._offsets[file_path] = (inode, offset)
+
+            f.seek(offset)
+            # A trailing partial line stays in the file for the next call
+            for lines, size in iter_line_blocks(read_chunks(f), []):
+                report = HandlersReport()
+                for line in lines:
+                    parse_log_line(line, report)
+                count += len(lines)
+
+                offset += size
+                with self._lock:
+                    self.report.merge(report)
+                    self._version += 1
+                    self._offsets[file_path] = (inode, offset)
+
+        return count
+
+    def ingest(self) -> int:
+        """Ingest new lines from all files and return how many were read."""
+        count = 0
+        for file_path in self.file_paths:
+            try:
+                count += self._ingest_file(file_path)
+            except OSError as e:
+                print(f"Error: cannot read {file_path}: {e}", file=sys.stderr)
+
+        return count
+
+    def render(self, fmt: str) -> str:
+        """Render the current report in the given format."""
+        with self._lock:
+            cached = self._cache.get(fmt)
+            if cached is not None and cached[0] == self._version:
+                return cached[1]
+
+            body = self._formatters[fmt].format(self.report)
+            self._cache[fmt] = (self._version, body)
+            return body
+
+    def follow(self, stop: threading.Event, interval: float = 1.0) -> None:
+        """Ingest new lines every interval seconds until stop is set."""
+        while not stop.is_set():
+            try:
+                self.ingest()
+            except Exception as e:
+                print(f"Error: ingestion failed: {e!r}", file=sys.stderr)
+            stop.wait(interval)
+
+
+class AggregatorRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler answering queries from the aggregator state."""
+
+    aggregator: LogAggregator
+    routes = {
+        "/handlers": ("json", "application/json"),
+        "/metrics": ("prometheus", "text/plain; version=0.0.4; charset=utf-8")
+    }
+
+    def do_GET(self) -> None:
+        """Serve the handlers report."""
+        route = self.routes.get(self.path.split('?', 1)[0])
+        if route is None:
+            self.send_error(404)
+            return
+
+        fmt, content_type = route
+        body = self.aggregator.render(fmt).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        """Return the client address, which is empty for Unix sockets."""
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        """Do not log every request."""
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server listening on a Unix socket."""
+
+    daemon_threads = True
+
+
+def make_server(
+    aggregator: LogAggregator,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Optional[Path] = None
+) -> socketserver.BaseServer:
+    """Create an HTTP server bound to a TCP address or a Unix socket."""
+    handler: Type[AggregatorRequestHandler] = type(
+        "BoundAggregatorRequestHandler",
+        (AggregatorRequestHandler,),
+        {"aggregator": aggregator}
+    )
+
+    if socket_path is not None:
+        if socket_path.is_socket():
+            socket_path.unlink()
+        elif socket_path.exists():
+            raise FileExistsError(f"Socket path exists and is not a socket: {socket_path}")
+        return UnixHTTPServer(str(socket_path), handler)
+
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(
+    aggregator: LogAggregator,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Optional[Path] = None,
+    interval: float = 1.0
+) -> None:
+    """Ingest logs in the background and serve queries until interrupted."""
+    server = make_server(aggregator, host, port, socket_path)
+    stop = threading.Event()
+    follower = threading.Thread(target=aggregator.follow, args=(stop, interval), daemon=True)
+    follower.start()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        follower.join()
+        if socket_path is not None and socket_path.is_socket():
+            socket_path.unlink()
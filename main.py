@@ -4,25 +4,30 @@
 import argparse
 import csv
 from pathlib import Path
-from typing import Dict, Type, Iterator
+from typing import Dict, Type
 
+from log_analyzer.models import ErrorsReport as ErrorsReportModel
 from log_analyzer.models import HandlersReport as HandlersReportModel
-from log_analyzer.parser import parse_log_files
-from log_analyzer.reports import HandlersReport, Report
+from log_analyzer.parser import STDIN
+from log_analyzer.reports import ErrorsReport, HandlersReport, Report
+from log_analyzer.server import LogAggregator, serve
 
 
 def get_available_reports() -> Dict[str, Type[Report]]:
     """Get all available reports."""
     return {
-        HandlersReport.name: HandlersReport
+        HandlersReport.name: HandlersReport,
+        ErrorsReport.name: ErrorsReport
     }
 
 
-def export_to_csv(log_files: Iterator[Path], csv_file: Path) -> None:
+def log_file_path(value: str) -> Path:
+    """Convert a command line argument to a log file path, '-' meaning stdin."""
+    return STDIN if value == '-' else Path(value)
+
+
+def export_to_csv(report_model: HandlersReportModel, csv_file: Path) -> None:
     """Export report data to CSV file."""
-    # Generate the report model directly
-    report_model = parse_log_files(log_files)
-    
     with open(csv_file, 'w', newline='') as f:
         writer = csv.writer(f)
         # Write header
@@ -52,6 +57,24 @@ def export_to_csv(log_files: Iterator[Path], csv_file: Path) -> None:
                         total_error, total_critical, total_all])
 
 
+def export_errors_to_csv(report_model: ErrorsReportModel, csv_file: Path) -> None:
+    """Export errors report data to CSV file."""
+    with open(csv_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Count', 'Level', 'Logger', 'First seen', 'Last seen', 'Template', 'Example'])
+
+        for template in report_model.get_sorted_templates():
+            writer.writerow([
+                template.count,
+                template.level,
+                template.logger,
+                template.first_seen,
+                template.last_seen,
+                template.template,
+                template.example
+            ])
+
+
 def main() -> None:
     """Main entry point."""
     # Set up argument parser
@@ -61,8 +84,8 @@ def main() -> None:
     parser.add_argument(
         "log_files",
         nargs="+",
-        type=Path,
-        help="Paths to log files to analyze"
+        type=log_file_path,
+        help="Paths to log files to analyze, '-' to read from stdin"
     )
     parser.add_argument(
         "--report",
@@ -75,9 +98,46 @@ def main() -> None:
         type=Path,
         help="Path to output CSV file"
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep running, follow the log files and serve the report over HTTP"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Host to listen on in serve mode"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to listen on in serve mode"
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Unix socket to listen on in serve mode instead of host and port"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for new log lines in serve mode"
+    )
     
     # Parse arguments
     args = parser.parse_args()
+
+    # Serve mode follows files as they grow, which stdin cannot do
+    if args.serve and any(log_file is STDIN for log_file in args.log_files):
+        parser.error("reading from stdin cannot be combined with --serve")
+
+    if args.serve and args.report != HandlersReport.name:
+        parser.error(f"--serve supports only the {HandlersReport.name} report")
+
+    if args.serve and args.csv:
+        parser.error("--serve cannot be combined with --csv")
     
     # Get report class
     reports = get_available_reports()
@@ -88,18 +148,24 @@ def main() -> None:
     log_files = iter(args.log_files)
     
     try:
-        # Generate and print report
-        result = report.generate(log_files)
-        print(result)
+        if args.serve:
+            aggregator = LogAggregator(args.log_files)
+            serve(aggregator, args.host, args.port, args.socket, args.interval)
+            return
+
+        # Parse the logs once, then print and export the same report
+        report_model = report.parse(log_files)
+        print(report.formatter.format(report_model))
         
         # Export to CSV if requested
         if args.csv:
-            # Get a fresh iterator for the log files
-            csv_log_files = iter(args.log_files)
-            export_to_csv(csv_log_files, args.csv)
+            if args.report == ErrorsReport.name:
+                export_errors_to_csv(report_model, args.csv)
+            else:
+                export_to_csv(report_model, args.csv)
             print(f"\nReport exported to CSV: {args.csv}")
             
-    except FileNotFoundError as e:
+    except OSError as e:
         print(f"Error: {e}")
         exit(1)
 
@@ -1,6 +1,9 @@
 # -- coding: utf-8
 """Tests for main module."""
 
+import csv
+import io
+import socket
 import sys
 from pathlib import Path
 from unittest.mock import patch
@@ -14,6 +17,7 @@ def test_get_available_reports():
     """Test get_available_reports function."""
     reports = get_available_reports()
     assert "handlers" in reports
+    assert "errors" in reports
 
 
 def test_main_missing_file(capsys):
@@ -37,3 +41,70 @@ def test_main_invalid_report(capsys):
 
         captured = capsys.readouterr()
         assert "invalid choice: 'invalid'" in captured.err
+
+
+def test_main_stdin_with_serve(capsys):
+    """Test main function rejects stdin combined with serve mode."""
+    test_args = ["main.py", "-", "--report", "handlers", "--serve"]
+    with patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit):
+            main()
+
+        captured = capsys.readouterr()
+        assert "reading from stdin cannot be combined with --serve" in captured.err
+
+
+def test_main_stdin_with_csv(capsys, monkeypatch, tmp_path: Path):
+    """Test main function prints and exports a report read from stdin once."""
+    log = "2025-03-27 12:13:15,000 INFO django.request: GET /api/v1/products/ 201 OK [192.168.1.72]\n"
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(log.encode("utf-8"))))
+    csv_path = tmp_path / "out.csv"
+
+    test_args = ["main.py", "-", "--report", "handlers", "--csv", str(csv_path)]
+    with patch.object(sys, "argv", test_args):
+        main()
+
+    captured = capsys.readouterr()
+    assert "Total requests: 1" in captured.out
+    with open(csv_path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[1] == ['/api/v1/products/', '0', '1', '0', '0', '0', '1']
+
+
+def test_main_serve_unsupported_report(capsys):
+    """Test main function rejects serve mode for reports other than handlers."""
+    test_args = ["main.py", "test.log", "--report", "errors", "--serve"]
+    with patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit):
+            main()
+
+        captured = capsys.readouterr()
+        assert "--serve supports only the handlers report" in captured.err
+
+
+def test_main_serve_with_csv(capsys):
+    """Test main function rejects serve mode combined with CSV export."""
+    test_args = ["main.py", "test.log", "--report", "handlers", "--serve", "--csv", "out.csv"]
+    with patch.object(sys, "argv", test_args):
+        with pytest.raises(SystemExit):
+            main()
+
+        captured = capsys.readouterr()
+        assert "--serve cannot be combined with --csv" in captured.err
+
+
+def test_main_serve_port_in_use(capsys):
+    """Test main function reports a busy port instead of a traceback."""
+    with socket.socket() as busy:
+        busy.bind(("127.0.0.1", 0))
+        busy.listen()
+        port = busy.getsockname()[1]
+
+        test_args = ["main.py", "test_logs/app1.log", "--report", "handlers", "--serve", "--port", str(port)]
+        with patch.object(sys, "argv", test_args):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+            assert exc_info.value.code == 1
+
+    captured = capsys.readouterr()
+    assert "Error: " in captured.out
@@ -1,5 +1,5 @@
 """Tests for models module."""
-from log_analyzer.models import HandlerStats, HandlersReport
+from log_analyzer.models import ErrorsReport, HandlerStats, HandlersReport
 
 
 def test_handler_stats_total():
@@ -80,3 +80,106 @@ def test_handlers_report_get_sorted_handlers():
     assert sorted_handlers[0].handler == "/api/v1/test1/"
     assert sorted_handlers[1].handler == "/api/v1/test2/"
     assert sorted_handlers[2].handler == "/api/v1/test3/"
+
+
+def test_errors_report_masks_variable_tokens():
+    """Test ErrorsReport.tokenize masks numbers and addresses."""
+    tokens = ErrorsReport.tokenize("Timeout after 30 s [192.168.1.10] id=abc")
+    assert tokens == ["Timeout", "after", "<*>", "s", "<*>", "id=abc"]
+
+
+def test_errors_report_groups_messages():
+    """Test ErrorsReport.add groups similar messages into one template."""
+    report = ErrorsReport()
+    report.add("ERROR", "django.request", "Internal Server Error: /a/ - ValueError: bad input", "2025-03-27 12:00:00,000")
+    report.add("ERROR", "django.request", "Internal Server Error: /b/ - ValueError: bad input", "2025-03-27 11:00:00,000")
+    report.add("ERROR", "django.request", "Internal Server Error: /a/ - OSError: disk full", "2025-03-27 13:00:00,000")
+    report.add("WARNING", "django.request", "Internal Server Error: /a/ - ValueError: bad input")
+
+    templates = report.get_sorted_templates()
+    assert report.total_errors == 4
+    assert len(templates) == 3
+    assert templates[0].template == "Internal Server Error: <*> - ValueError: bad input"
+    assert templates[0].count == 2
+    assert templates[0].first_seen == "2025-03-27 11:00:00,000"
+    assert templates[0].last_seen == "2025-03-27 12:00:00,000"
+    assert templates[0].example == "Internal Server Error: /a/ - ValueError: bad input"
+
+
+def test_errors_report_merge():
+    """Test ErrorsReport.merge method."""
+    report1 = ErrorsReport()
+    report1.add("CRITICAL", "django.core.management", "DatabaseError: Deadlock detected", "2025-03-27 12:00:00,000")
+
+    report2 = ErrorsReport()
+    report2.add("CRITICAL", "django.core.management", "DatabaseError: Deadlock detected", "2025-03-28 12:00:00,000")
+    report2.add("WARNING", "django.security", "OSError: No space left on device", "2025-03-28 12:00:00,000")
+
+    report1.merge(report2)
+    templates = report1.get_sorted_templates()
+    assert len(templates) == 2
+    assert templates[0].count == 2
+    assert templates[0].first_seen == "2025-03-27 12:00:00,000"
+    assert templates[0].last_seen == "2025-03-28 12:00:00,000"
+
+
+def test_errors_report_variable_token_in_prefix():
+    """Test that a variable token at the start of a message does not split its template."""
+    report = ErrorsReport()
+    for i in range(5):
+        report.add("ERROR", "django.request", f"GET /api/v1/users/{i}/abc failed with code E{i}x")
+    report.add("ERROR", "django.security", "user alice failed login from office")
+    report.add("ERROR", "django.security", "user bob failed login from office")
+    report.add("ERROR", "django.security", "alice logged in from office")
+    report.add("ERROR", "django.security", "bob logged in from office")
+
+    templates = {template.template: template.count for template in report.templates}
+    assert templates == {
+        "GET <*> failed with code <*>": 5,
+        "user <*> failed login from office": 2,
+        "<*> logged in from office": 2
+    }
+
+
+def test_errors_report_param_heavy_messages():
+    """Test that messages with mostly variable tokens join their template."""
+    report = ErrorsReport()
+    report.add("ERROR", "worker", "Retry 3 of 5 for alice")
+    report.add("ERROR", "worker", "Retry 3 of 5 for bob")
+
+    other = ErrorsReport()
+    other.add("ERROR", "worker", "Retry 4 of 5 for carol")
+    report.merge(other)
+
+    assert [template.template for template in report.templates] == ["Retry <*> of <*> for <*>"]
+    assert report.total_errors == 3
+
+
+def test_errors_report_after_cache_eviction():
+    """Test that an evicted message still finds its template."""
+    report = ErrorsReport(cache_size=1)
+    report.add("ERROR", "worker", "Timeout 31")
+    report.add("ERROR", "worker", "Queue is full")
+    report.add("ERROR", "worker", "Timeout 32")
+    report.add("ERROR", "worker", "Timeout 31")
+
+    templates = {template.template: template.count for template in report.templates}
+    assert templates == {"Timeout <*>": 3, "Queue is full": 1}
+
+
+def test_errors_report_bounded_leaves():
+    """Test that many messages which do not cluster keep leaves bounded."""
+    def word(i: int) -> str:
+        letters = ""
+        while True:
+            letters += chr(ord("a") + i % 26)
+            i //= 26
+            if not i:
+                return letters
+
+    report = ErrorsReport(max_templates=50)
+    for i in range(3000):
+        report.add("ERROR", "worker", f"job{i} step{i} {word(i)} {word(i + 7)}x {word(i * 3)}y")
+
+    assert len(report.templates) == 3000
+    assert max(len(bucket) for bucket in report._tree.values()) <= 50
@@ -2,6 +2,7 @@
 """Tests for parser module."""
 
 import csv
+import io
 import json
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -10,7 +11,9 @@ from typing import Iterator
 import pytest
 
 from log_analyzer.parser import parse_log_file, parse_log_files, convert_log_line_to_json
-from main import export_to_csv
+from log_analyzer.parser import convert_message_line_to_json, parse_error_file, parse_error_files
+from log_analyzer.parser import STDIN, iter_line_blocks, iter_stream_lines, parse_stream, read_chunks
+from main import export_errors_to_csv, export_to_csv
 
 
 @pytest.fixture
@@ -160,7 +163,7 @@ def test_export_to_csv(sample_log_file: Path):
     
     try:
         # Export to CSV
-        export_to_csv([sample_log_file], csv_path)
+        export_to_csv(parse_log_files([sample_log_file]), csv_path)
         
         # Read and verify CSV contents
         with open(csv_path, 'r', newline='') as f:
@@ -181,3 +184,185 @@ def test_export_to_csv(sample_log_file: Path):
     finally:
         # Cleanup
         csv_path.unlink()
+
+
+@pytest.fixture
+def sample_error_log_file() -> Iterator[Path]:
+    """Create a temporary log file with error messages."""
+
+    log_lines = [
+        "2025-03-28 12:40:47,000 CRITICAL django.core.management: DatabaseError: Deadlock detected",
+        "2025-03-27 12:40:47,000 CRITICAL django.core.management: DatabaseError: Deadlock detected",
+        "2025-03-27 12:26:18,000 WARNING django.security: ConnectionError: Failed to connect to payment gateway",
+        "2025-03-27 12:26:19,000 INFO django.security: ConnectionError: Failed to connect to payment gateway",
+        "2025-03-27 12:13:15,000 INFO django.request: GET /api/v1/products/ 201 OK [192.168.1.72]",
+        json.dumps({
+            "timestamp": "2025-03-27 12:00:00,000",
+            "logger": "django.request",
+            "levelname": "ERROR",
+            "message": "Internal Server Error: /api/v1/cart/ [192.168.1.29] - ValueError: Invalid input data"
+        }),
+        "invalid line"
+    ]
+
+    with NamedTemporaryFile(mode='w', delete=False) as f:
+        f.write("\n".join(log_lines) + "\n")
+        temp_path = Path(f.name)
+
+    yield temp_path
+    temp_path.unlink()
+
+
+def test_convert_message_line_to_json():
+    """Test converting a log line of any logger to JSON."""
+    log_line = "2025-03-28 12:40:47,000 CRITICAL django.core.management: DatabaseError: Deadlock detected"
+    result = convert_message_line_to_json(log_line)
+
+    assert result == {
+        "timestamp": "2025-03-28 12:40:47,000",
+        "levelname": "CRITICAL",
+        "logger": "django.core.management",
+        "message": "DatabaseError: Deadlock detected"
+    }
+    assert convert_message_line_to_json("This is not a valid log line") == {}
+
+
+def test_convert_message_line_to_json_bracketed():
+    """Test converting a log line with bracketed timestamp and logger to JSON."""
+    log_line = "[2024-03-20 10:15:31,890] CRITICAL [django.core] Database connection failed: Connection refused"
+    result = convert_message_line_to_json(log_line)
+
+    assert result == {
+        "timestamp": "2024-03-20 10:15:31,890",
+        "levelname": "CRITICAL",
+        "logger": "django.core",
+        "message": "Database connection failed: Connection refused"
+    }
+
+
+def test_parse_error_file(sample_error_log_file: Path):
+    """Test parse_error_file function."""
+
+    report = parse_error_file(sample_error_log_file)
+
+    assert report.total_errors == 4
+    templates = report.get_sorted_templates()
+    assert len(templates) == 3
+
+    deadlock = templates[0]
+    assert deadlock.level == "CRITICAL"
+    assert deadlock.logger == "django.core.management"
+    assert deadlock.template == "DatabaseError: Deadlock detected"
+    assert deadlock.count == 2
+    assert deadlock.first_seen == "2025-03-27 12:40:47,000"
+    assert deadlock.last_seen == "2025-03-28 12:40:47,000"
+    assert deadlock.example.startswith("2025-03-28 12:40:47,000 CRITICAL")
+
+    server_error = [t for t in templates if t.logger == "django.request"][0]
+    assert server_error.template == "Internal Server Error: /api/v1/cart/ <*> - ValueError: Invalid input data"
+
+
+def test_parse_error_files(sample_error_log_file: Path):
+    """Test parse_error_files function."""
+
+    report = parse_error_files([sample_error_log_file, sample_error_log_file])
+
+    assert report.total_errors == 8
+    assert len(report.templates) == 3
+
+
+def test_parse_error_files_missing_file():
+    """Test parse_error_files with missing file."""
+    with pytest.raises(FileNotFoundError):
+        parse_error_files([Path("non_existent_file.log")])
+
+
+def test_export_errors_to_csv(sample_error_log_file: Path):
+    """Test exporting errors report to CSV."""
+    with NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+        csv_path = Path(f.name)
+
+    try:
+        export_errors_to_csv(parse_error_files([sample_error_log_file]), csv_path)
+
+        with open(csv_path, 'r', newline='') as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ['Count', 'Level', 'Logger', 'First seen', 'Last seen', 'Template', 'Example']
+        assert rows[1][:6] == [
+            '2', 'CRITICAL', 'django.core.management', '2025-03-27 12:40:47,000',
+            '2025-03-28 12:40:47,000', 'DatabaseError: Deadlock detected'
+        ]
+        assert len(rows) == 4
+
+    finally:
+        csv_path.unlink()
+
+
+def test_iter_stream_lines_split_chunks():
+    """Test that lines split across chunk boundaries are joined."""
+    chunks = [b"first li", b"ne\nsecond", b"", b" line\nthi", b"rd line"]
+    assert list(iter_stream_lines(chunks)) == ["first line", "second line", "third line"]
+
+
+def test_iter_stream_lines_split_utf8():
+    """Test that a multibyte character split across chunks is decoded."""
+    data = "путь\n".encode('utf-8')
+    assert list(iter_stream_lines([data[:3], data[3:]])) == ["путь"]
+
+
+def test_iter_line_blocks_consumed_bytes():
+    """Test that blocks report their size and the partial tail stays pending."""
+    pending = []
+    blocks = list(iter_line_blocks([b"one\ntw", b"o\nthr", b"ee"], pending))
+
+    assert blocks == [(["one"], 4), (["two"], 4)]
+    assert b"".join(pending) == b"three"
+
+
+def test_iter_stream_lines_tiny_chunks():
+    """Test a long line arriving in many tiny chunks without a newline."""
+    chunks = [b"x"] * 200000 + [b"\nend"]
+    lines = list(iter_stream_lines(chunks))
+    assert lines == ["x" * 200000, "end"]
+
+
+def test_parse_stream(sample_log_file: Path):
+    """Test parse_stream returns the same report as parse_log_file."""
+    expected = parse_log_file(sample_log_file)
+
+    with open(sample_log_file, 'rb') as f:
+        assert parse_stream(read_chunks(f, size=7)) == expected
+
+    with open(sample_log_file, 'rb') as f:
+        assert parse_stream(read_chunks(f)) == expected
+
+
+def test_parse_log_files_stdin(sample_log_file: Path, monkeypatch):
+    """Test parse_log_files reads stdin for '-'."""
+    stdin = io.TextIOWrapper(io.BytesIO(sample_log_file.read_bytes()))
+    monkeypatch.setattr("sys.stdin", stdin)
+
+    report = parse_log_files([STDIN, sample_log_file])
+
+    assert report.handlers["/api/v1/test/"].info == 2
+
+
+def test_parse_log_files_file_named_dash(sample_log_file: Path, monkeypatch, tmp_path: Path):
+    """Test that a real file named '-' is read when given as './-'."""
+    (tmp_path / "-").write_bytes(sample_log_file.read_bytes())
+    monkeypatch.chdir(tmp_path)
+
+    report = parse_log_files([Path("./-")])
+
+    assert report.handlers["/api/v1/test/"].info == 1
+
+
+def test_parse_error_files_stdin(sample_error_log_file: Path, monkeypatch):
+    """Test parse_error_files reads stdin for '-'."""
+    stdin = io.TextIOWrapper(io.BytesIO(sample_error_log_file.read_bytes()))
+    monkeypatch.setattr("sys.stdin", stdin)
+
+    report = parse_error_files([STDIN])
+
+    assert report.total_errors == 4
@@ -6,9 +6,10 @@ from typing import Iterator
 
 import pytest
 
-from log_analyzer.models import HandlerStats, HandlersReport
+from log_analyzer.models import ErrorsReport, HandlerStats, HandlersReport
+from log_analyzer.reports import ErrorsReport as ErrorsReportImpl
 from log_analyzer.reports import HandlersReport as HandlersReportImpl
-from log_analyzer.reports import HandlersReportFormatter
+from log_analyzer.reports import ErrorsReportFormatter, HandlersReportFormatter
 
 
 @pytest.fixture
@@ -78,3 +79,29 @@ def test_handlers_report_default_formatter():
     """Test HandlersReport with default formatter."""
     report = HandlersReportImpl()
     assert isinstance(report.formatter, HandlersReportFormatter)
+
+
+def test_errors_report_formatter():
+    """Test ErrorsReportFormatter.format method."""
+    report = ErrorsReport()
+    report.add("WARNING", "django.security", "OSError: No space left on device", "2025-03-27 12:00:00,000")
+    report.add("CRITICAL", "django.core.management", "DatabaseError: Deadlock detected", "2025-03-27 12:00:00,000")
+    report.add("CRITICAL", "django.core.management", "DatabaseError: Deadlock detected", "2025-03-28 12:00:00,000")
+
+    output = ErrorsReportFormatter().format(report)
+
+    assert "Total errors: 3" in output
+    assert "TEMPLATE" in output
+    assert "example: DatabaseError: Deadlock detected" in output
+
+    # Check that the most frequent template goes first
+    data_lines = [line for line in output.split("\n") if line.startswith(("1 ", "2 "))]
+    assert "DatabaseError: Deadlock detected" in data_lines[0]
+    assert "2025-03-28 12:00:00,000" in data_lines[0]
+    assert "OSError: No space left on device" in data_lines[1]
+
+
+def test_errors_report_default_formatter():
+    """Test ErrorsReport with default formatter."""
+    report = ErrorsReportImpl()
+    assert isinstance(report.formatter, ErrorsReportFormatter)
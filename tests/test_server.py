@@ -0,0 +1,243 @@
+# -- coding: utf-8
+"""Tests for server module."""
+
+import json
+import socket
+import threading
+import urllib.request
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterator
+
+import pytest
+
+from log_analyzer import server as server_module
+from log_analyzer.server import LogAggregator, make_server, serve
+
+LINE = "2025-03-27 12:13:15,000 {level} django.request: GET {path} 200 OK [192.168.1.72]\n"
+
+
+@pytest.fixture
+def log_file() -> Iterator[Path]:
+    """Create a temporary log file that can grow during the test."""
+    with TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "app.log"
+        file_path.write_text(
+            LINE.format(level="INFO", path="/api/v1/test/")
+            + "2025-03-27 12:13:15,000 CRITICAL django.core.management: DatabaseError: Deadlock detected\n"
+        )
+        yield file_path
+
+
+def append(file_path: Path, text: str) -> None:
+    """Append text to a log file."""
+    with open(file_path, 'a') as f:
+        f.write(text)
+
+
+def test_aggregator_missing_file():
+    """Test LogAggregator with missing file."""
+    with pytest.raises(FileNotFoundError):
+        LogAggregator([Path("non_existent_file.log")])
+
+
+def test_aggregator_ingests_incrementally(log_file: Path):
+    """Test that only new lines are ingested."""
+    aggregator = LogAggregator([log_file])
+    assert aggregator.ingest() == 2
+    assert aggregator.ingest() == 0
+
+    append(log_file, LINE.format(level="ERROR", path="/api/v1/test/"))
+    assert aggregator.ingest() == 1
+
+    stats = aggregator.report.handlers["/api/v1/test/"]
+    assert stats.info == 1
+    assert stats.error == 1
+
+
+def test_aggregator_partial_line(log_file: Path):
+    """Test that a line is not counted until it is complete."""
+    aggregator = LogAggregator([log_file])
+    aggregator.ingest()
+
+    line = LINE.format(level="WARNING", path="/api/v1/other/")
+    append(log_file, line[:30])
+    assert aggregator.ingest() == 0
+
+    append(log_file, line[30:])
+    assert aggregator.ingest() == 1
+    assert aggregator.report.handlers["/api/v1/other/"].warning == 1
+
+
+def test_aggregator_truncated_file(log_file: Path):
+    """Test that a truncated file is read from the beginning."""
+    aggregator = LogAggregator([log_file])
+    aggregator.ingest()
+
+    log_file.write_text(LINE.format(level="DEBUG", path="/api/v1/test/"))
+    assert aggregator.ingest() == 1
+    assert aggregator.report.handlers["/api/v1/test/"].debug == 1
+
+
+def test_aggregator_reads_in_chunks(log_file: Path, monkeypatch):
+    """Test that lines split across read chunks are ingested once."""
+    monkeypatch.setattr(server_module, "read_chunks", lambda f: iter(lambda: f.read(7), b''))
+    aggregator = LogAggregator([log_file])
+    append(log_file, LINE.format(level="INFO", path="/api/v1/test/")[:40])
+
+    assert aggregator.ingest() == 2
+    assert aggregator.report.handlers["/api/v1/test/"].info == 1
+
+    append(log_file, LINE.format(level="INFO", path="/api/v1/test/")[40:])
+    assert aggregator.ingest() == 1
+    assert aggregator.report.handlers["/api/v1/test/"].info == 2
+
+
+def test_aggregator_unreadable_file(log_file: Path, capsys):
+    """Test that an unreadable file does not stop ingestion of the others."""
+    other_file = log_file.parent / "other.log"
+    other_file.write_text(LINE.format(level="ERROR", path="/api/v1/other/"))
+    aggregator = LogAggregator([log_file, other_file])
+
+    log_file.unlink()
+    log_file.mkdir()
+    assert aggregator.ingest() == 1
+    assert aggregator.report.handlers["/api/v1/other/"].error == 1
+    assert f"Error: cannot read {log_file}" in capsys.readouterr().err
+
+    log_file.rmdir()
+
+
+def test_aggregator_follow_survives_errors(log_file: Path, monkeypatch, capsys):
+    """Test that follow keeps ingesting after an unexpected error."""
+    aggregator = LogAggregator([log_file])
+    ingest = aggregator.ingest
+    calls = []
+    stop = threading.Event()
+
+    def failing_ingest() -> int:
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        stop.set()
+        return ingest()
+
+    monkeypatch.setattr(aggregator, "ingest", failing_ingest)
+    aggregator.follow(stop, interval=0.01)
+
+    assert len(calls) == 2
+    assert aggregator.report.handlers["/api/v1/test/"].info == 1
+    assert "boom" in capsys.readouterr().err
+
+
+def test_aggregator_render(log_file: Path):
+    """Test rendering the report as JSON and Prometheus metrics."""
+    aggregator = LogAggregator([log_file])
+    aggregator.ingest()
+
+    data = json.loads(aggregator.render("json"))
+    assert data["total_requests"] == 1
+    assert data["handlers"][0]["handler"] == "/api/v1/test/"
+    assert data["handlers"][0]["info"] == 1
+
+    metrics = aggregator.render("prometheus")
+    assert '# TYPE django_requests_total counter' in metrics
+    assert 'django_requests_total{handler="/api/v1/test/",level="info"} 1' in metrics
+
+    append(log_file, LINE.format(level="INFO", path="/api/v1/test/"))
+    aggregator.ingest()
+    assert json.loads(aggregator.render("json"))["total_requests"] == 2
+
+
+def test_http_server(log_file: Path):
+    """Test serving the report over HTTP on localhost."""
+    aggregator = LogAggregator([log_file])
+    aggregator.ingest()
+    server = make_server(aggregator, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{url}/handlers") as response:
+            assert response.headers["Content-Type"] == "application/json"
+            assert json.loads(response.read())["total_requests"] == 1
+
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            assert b'level="info"} 1' in response.read()
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(f"{url}/unknown")
+        assert exc_info.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unix_socket_server(log_file: Path):
+    """Test serving the report over a Unix socket."""
+    aggregator = LogAggregator([log_file])
+    aggregator.ingest()
+    socket_path = log_file.parent / "aggregator.sock"
+    server = make_server(aggregator, socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            client.sendall(b"GET /handlers HTTP/1.0\r\n\r\n")
+            response = b""
+            while chunk := client.recv(4096):
+                response += chunk
+
+        headers, body = response.split(b"\r\n\r\n", 1)
+        assert headers.startswith(b"HTTP/1.0 200")
+        assert json.loads(body)["total_requests"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_unix_socket_keeps_regular_file(log_file: Path):
+    """Test that an existing regular file is not replaced by the socket."""
+    aggregator = LogAggregator([log_file])
+    content = log_file.read_text()
+
+    with pytest.raises(FileExistsError):
+        make_server(aggregator, socket_path=log_file)
+
+    assert log_file.is_file()
+    assert log_file.read_text() == content
+
+
+def test_serve_answers_before_initial_ingestion(log_file: Path, monkeypatch):
+    """Test that queries are answered while the initial ingestion is running."""
+    aggregator = LogAggregator([log_file])
+    ingest = aggregator.ingest
+    release = threading.Event()
+    servers = []
+
+    def slow_ingest() -> int:
+        release.wait(5)
+        return ingest()
+
+    def record_server(*args, **kwargs):
+        servers.append(make_server(*args, **kwargs))
+        return servers[0]
+
+    monkeypatch.setattr(aggregator, "ingest", slow_ingest)
+    monkeypatch.setattr(server_module, "make_server", record_server)
+    thread = threading.Thread(target=serve, args=(aggregator,), kwargs={"port": 0, "interval": 0.01}, daemon=True)
+    thread.start()
+
+    try:
+        while not servers:
+            release.wait(0.01)
+        url = f"http://127.0.0.1:{servers[0].server_address[1]}/handlers"
+        with urllib.request.urlopen(url, timeout=2) as response:
+            assert json.loads(response.read())["total_requests"] == 0
+    finally:
+        release.set()
+        servers[0].shutdown()
+        thread.join(5)